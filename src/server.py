@@ -1,24 +1,113 @@
 #!/usr/bin/env python3
 """Google Sheets MCP Server - FastMCP with formulas, formatting, charts, validation"""
 
+import asyncio
+import json
+import logging
 import os
-from typing import Annotated, Optional, List
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional, Set, Tuple
 from dotenv import load_dotenv
 from fastmcp import FastMCP, Context
 from pydantic import Field
+from pydantic_core import from_json
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-import json
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, Resource
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
+from googleapiclient.model import JsonModel
+
+try:
+    from mcp_types.version import MODERN_PROTOCOL_VERSIONS
+except ImportError:  # older MCP SDKs only speak the session-based protocol
+    MODERN_PROTOCOL_VERSIONS = ()
 
 load_dotenv()
 
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
-mcp = FastMCP("Google Sheets")
+# Credential configuration, resolved once at import
+CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
+CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
+REFRESH_TOKEN = os.getenv('GOOGLE_REFRESH_TOKEN')
+CREDS_DIR = os.getenv('GDRIVE_CREDS_DIR', os.path.expanduser('~/.config/mcp-gdrive'))
+TOKEN_FILE = os.path.join(CREDS_DIR, 'sheets-token.json')
+CREDENTIALS_FILE = os.path.join(CREDS_DIR, 'gcp-oauth.keys.json')
+
+logger = logging.getLogger(__name__)
+
+# Refresh credentials this long before they expire
+REFRESH_MARGIN = timedelta(minutes=5)
 
 _creds: Optional[Credentials] = None
+_creds_lock = threading.Lock()
+_service: Optional[Resource] = None
+
+# Worker threads that execute blocking Sheets API requests
+MAX_WORKERS = int(os.getenv('SHEETS_MAX_WORKERS', '8'))
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='sheets-api')
+_thread_local = threading.local()
+
+# Client-side pacing to stay under the Sheets API per-user quotas
+READS_PER_MINUTE = int(os.getenv('SHEETS_READS_PER_MINUTE', '60'))
+WRITES_PER_MINUTE = int(os.getenv('SHEETS_WRITES_PER_MINUTE', '60'))
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 64
+
+# Rate-limit and transient server errors retried with backoff for idempotent requests
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses retried for other requests: a POST that hit a 500, 502 or 504 may already have been applied
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429, 503})
+
+# HTTP methods that can be repeated without applying an edit twice
+IDEMPOTENT_METHODS = frozenset({'GET', 'PUT'})
+
+# How long a spreadsheet's sheet name -> ID mapping is reused before re-fetching
+SHEET_ID_TTL_SECONDS = 300
+
+_sheet_ids: Dict[str, Tuple[float, Dict[str, int]]] = {}
+
+# batchUpdate request types that add, remove or rename sheets and so stale the cached IDs
+SHEET_STRUCTURE_REQUESTS = frozenset({'addSheet', 'deleteSheet', 'updateSheetProperties', 'duplicateSheet'})
+
+# Window during which batchUpdate requests for the same spreadsheet are coalesced
+BATCH_WINDOW_SECONDS = int(os.getenv('SHEETS_BATCH_WINDOW_MS', '50')) / 1000
+
+# GridRange bounds that must all be present for two repeatCell ranges to be merged
+GRID_RANGE_KEYS = ('sheetId', 'startRowIndex', 'endRowIndex', 'startColumnIndex', 'endColumnIndex')
+
+_pending_batches: Dict[str, List[Tuple[List[dict], asyncio.Future]]] = {}
+_flush_tasks: Set[asyncio.Task] = set()
+
+# Requests held by sheets_begin_batch until sheets_commit_batch or sheets_discard_batch,
+# per (client session, spreadsheet) so one client's batch never captures another's edits
+_open_batches: Dict[Tuple[str, str], List[dict]] = {}
+
+# Most requests one open batch may hold before further edits are refused
+MAX_HELD_REQUESTS = 1000
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _expiring(creds: Credentials) -> bool:
+    """Whether credentials are invalid or expire within REFRESH_MARGIN."""
+    if not creds.valid:
+        return True
+    return creds.expiry is not None and creds.expiry - _utcnow() < REFRESH_MARGIN
 
 
 def get_credentials():
@@ -27,53 +116,439 @@ def get_credentials():
     Supports two modes:
     1. Environment variables (for deployment): GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, GOOGLE_REFRESH_TOKEN
     2. File-based (for local dev): GDRIVE_CREDS_DIR with gcp-oauth.keys.json and sheets-token.json
+
+    Credentials are cached and only refreshed once they are within REFRESH_MARGIN of expiry.
     """
     global _creds
 
-    # Mode 1: Environment variables (for deployment)
-    client_id = os.getenv('GOOGLE_CLIENT_ID')
-    client_secret = os.getenv('GOOGLE_CLIENT_SECRET')
-    refresh_token = os.getenv('GOOGLE_REFRESH_TOKEN')
-
-    if client_id and client_secret and refresh_token:
-        # Always create fresh credentials in serverless environment
-        creds = Credentials(
-            token=None,
-            refresh_token=refresh_token,
-            token_uri='https://oauth2.googleapis.com/token',
-            client_id=client_id,
-            client_secret=client_secret,
-            scopes=SCOPES
-        )
-        creds.refresh(Request())
+    with _creds_lock:
+        if _creds and not _expiring(_creds):
+            return _creds
+
+        # Mode 1: Environment variables (for deployment)
+        if CLIENT_ID and CLIENT_SECRET and REFRESH_TOKEN:
+            creds = _creds or Credentials(
+                token=None,
+                refresh_token=REFRESH_TOKEN,
+                token_uri='https://oauth2.googleapis.com/token',
+                client_id=CLIENT_ID,
+                client_secret=CLIENT_SECRET,
+                scopes=SCOPES
+            )
+            creds.refresh(Request())
+            _creds = creds
+            return creds
+
+        # Mode 2: File-based (for local development)
+        creds = _creds
+        if not creds and os.path.exists(TOKEN_FILE):
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+
+        if not creds or _expiring(creds):
+            if creds and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_FILE, SCOPES)
+                creds = flow.run_local_server(port=0)
+
+            os.makedirs(CREDS_DIR, exist_ok=True)
+            with open(TOKEN_FILE, 'w') as token:
+                token.write(creds.to_json())
+
+        _creds = creds
         return creds
 
-    # Mode 2: File-based - use caching for local dev
-    if _creds and _creds.valid:
-        return _creds
 
-    # Mode 2: File-based (for local development)
-    creds_dir = os.getenv('GDRIVE_CREDS_DIR', os.path.expanduser('~/.config/mcp-gdrive'))
-    token_file = os.path.join(creds_dir, 'sheets-token.json')
-    credentials_file = os.path.join(creds_dir, 'gcp-oauth.keys.json')
+async def _refresh_credentials_loop():
+    """Refresh cached credentials shortly before they expire, off the request path."""
+    while True:
+        creds = _creds
+        if creds is None or creds.expiry is None:
+            delay = 60
+        else:
+            delay = (creds.expiry - _utcnow() - REFRESH_MARGIN).total_seconds()
+        await asyncio.sleep(max(delay, 30))
+
+        if _creds is None:
+            continue
+        try:
+            await asyncio.to_thread(get_credentials)
+        except Exception:
+            logger.warning("Background credential refresh failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Build the API service and run the background credential refresher for the lifetime of the server."""
+    await asyncio.to_thread(get_service)
+    task = asyncio.create_task(_refresh_credentials_loop())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+class _JsonModel(JsonModel):
+    """JsonModel that writes compact request bodies and parses responses natively.
+
+    Request bodies are written without the separator whitespace json.dumps adds
+    by default, with non-ASCII text escaped so the body stays ASCII.
+    Responses are parsed from the raw bytes without an intermediate str copy,
+    interning only object keys, which repeat in every row of a values response.
+    """
 
-    creds = None
-    if os.path.exists(token_file):
-        creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return json.dumps(body_value, separators=(',', ':'))
+
+    def deserialize(self, content):
+        try:
+            body = from_json(content, cache_strings='keys')
+        except ValueError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def get_service() -> Resource:
+    """Get the Google Sheets API service, which only builds request objects.
+
+    `build()` parses the discovery document and synthesizes the resource classes,
+    so the service is built once (by the lifespan, off the event loop) and reused.
+    It holds no credentials: requests are executed in worker threads with an
+    authorized client (_execute_in_thread), so tools never wait on a token
+    refresh on the event loop.
+    """
+    global _service
+
+    if _service is None:
+        _service = build(
+            'sheets', 'v4', http=build_http(), cache_discovery=False, static_discovery=True,
+            model=_JsonModel()
+        )
+    return _service
+
+
+def _thread_http(credentials: Credentials) -> AuthorizedHttp:
+    """Return an authorized HTTP client backed by this worker thread's connection pool.
+
+    httplib2.Http is not thread-safe, so each worker thread keeps its own instance
+    and reuses its open connections across requests.
+    """
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = build_http()
+    return AuthorizedHttp(credentials, http=http)
+
+
+def _execute_in_thread(request: HttpRequest):
+    """Execute a request with the calling worker thread's HTTP client.
+
+    Credentials are fetched here, so any wait on a token refresh blocks a worker, not the event loop.
+    """
+    return request.execute(http=_thread_http(get_credentials()))
+
+
+class _RateLimiter:
+    """Token bucket that paces requests to a per-minute quota."""
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60
+        self.capacity = per_minute
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent without exceeding the quota."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else jittered exponential backoff.
+
+    Both are capped at MAX_RETRY_DELAY.
+    """
+    retry_after = error.resp.get('retry-after')
+    if retry_after and retry_after.isdigit():
+        return min(MAX_RETRY_DELAY, int(retry_after))
+    return min(MAX_RETRY_DELAY, 2 ** attempt + random.uniform(0, 1))
+
+
+async def _execute(request: HttpRequest):
+    """Execute a Sheets API request in a worker thread so the event loop is not blocked.
+
+    Requests are paced by the read or write quota limiter. 429 and transient 5xx
+    responses are retried after the delay the API asks for, or with backoff.
+    POST requests are only retried on 429 and 503, which mean they were not applied.
+    """
+    limiter = _read_limiter if request.method == 'GET' else _write_limiter
+    retry_statuses = RETRY_STATUSES if request.method in IDEMPOTENT_METHODS else NON_IDEMPOTENT_RETRY_STATUSES
+    loop = asyncio.get_running_loop()
+
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.acquire()
+        try:
+            return await loop.run_in_executor(_executor, _execute_in_thread, request)
+        except HttpError as e:
+            if e.resp.status not in retry_statuses or attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+
+_read_limiter = _RateLimiter(READS_PER_MINUTE)
+_write_limiter = _RateLimiter(WRITES_PER_MINUTE)
+
+
+async def _lookup_sheet_id(spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+    """Look up a sheet ID by name from the cached sheet list.
+
+    All of a spreadsheet's sheets are cached together for SHEET_ID_TTL_SECONDS.
+    The list is re-fetched when it expires or doesn't contain the name, so newly
+    added sheets are still found.
+    """
+    cached = _sheet_ids.get(spreadsheet_id)
+    if cached is None or time.monotonic() - cached[0] > SHEET_ID_TTL_SECONDS or sheet_name not in cached[1]:
+        spreadsheet = await _execute(get_service().spreadsheets().get(
+            spreadsheetId=spreadsheet_id, fields='sheets.properties(sheetId,title)'
+        ))
+        sheet_ids = {
+            sheet['properties']['title']: sheet['properties']['sheetId']
+            for sheet in spreadsheet.get('sheets', [])
+        }
+        cached = _sheet_ids[spreadsheet_id] = (time.monotonic(), sheet_ids)
+    return cached[1].get(sheet_name)
+
+
+async def _batch_update(spreadsheet_id: str, requests: List[dict]) -> List[dict]:
+    """Queue batchUpdate requests and return their replies.
+
+    Requests for the same spreadsheet that arrive within BATCH_WINDOW_SECONDS are
+    sent together in a single batchUpdate call. batchUpdate is atomic, so if the
+    API rejects the combined call, each caller's requests are resent on their own
+    and only the caller whose request is invalid receives the error.
+    """
+    future = asyncio.get_running_loop().create_future()
+    pending = _pending_batches.get(spreadsheet_id)
+    if pending is None:
+        pending = _pending_batches[spreadsheet_id] = []
+        task = asyncio.create_task(_flush_batch(spreadsheet_id))
+        _flush_tasks.add(task)
+        task.add_done_callback(_flush_tasks.discard)
+    pending.append((requests, future))
+    return await future
+
+
+def _batch_key(ctx: Optional[Context], spreadsheet_id: str) -> Optional[Tuple[str, str]]:
+    """Key of the batch the calling client session may have open for a spreadsheet.
+
+    None when the connection has no session: stateless protocol versions give every
+    request a fresh session ID, so nothing could tie a later edit to the batch.
+    """
+    request_context = ctx.request_context if ctx else None
+    if request_context is None or getattr(request_context, 'protocol_version', None) in MODERN_PROTOCOL_VERSIONS:
+        return None
+    return (ctx.session_id, spreadsheet_id)
+
+
+def _hold(ctx: Optional[Context], spreadsheet_id: str, requests: List[dict]) -> Dict[str, Any]:
+    """Add requests to the session's open batch for the spreadsheet instead of sending them.
+
+    Callers check that a batch is open first. The result says the edit was
+    queued, not applied; its replies come from sheets_commit_batch.
+    """
+    held = _open_batches[_batch_key(ctx, spreadsheet_id)]
+    if len(held) + len(requests) > MAX_HELD_REQUESTS:
+        return {'error': f'Batch for {spreadsheet_id} already holds {len(held)} request(s); commit or discard it first'}
+
+    held.extend(requests)
+    return {
+        'held': True,
+        'heldCount': len(held),
+        'message': f'Queued {len(requests)} request(s) until sheets_commit_batch'
+    }
+
+
+def _merged_range(first: dict, second: dict) -> Optional[dict]:
+    """Union of two GridRanges that abut along a full edge, or None if they do not form a rectangle."""
+    if any(key not in first or key not in second for key in GRID_RANGE_KEYS):
+        return None
+    if first['sheetId'] != second['sheetId']:
+        return None
+    same_cols = (first['startColumnIndex'], first['endColumnIndex']) == (second['startColumnIndex'], second['endColumnIndex'])
+    if same_cols and first['endRowIndex'] == second['startRowIndex']:
+        return {**first, 'endRowIndex': second['endRowIndex']}
+    same_rows = (first['startRowIndex'], first['endRowIndex']) == (second['startRowIndex'], second['endRowIndex'])
+    if same_rows and first['endColumnIndex'] == second['startColumnIndex']:
+        return {**first, 'endColumnIndex': second['endColumnIndex']}
+    return None
+
+
+def _merge_repeat_cells(requests: List[dict]) -> Tuple[List[dict], Set[int]]:
+    """Fold each repeatCell into the one before it when both apply the same format to abutting ranges.
+
+    Only consecutive requests are merged, so edits still apply in the original order.
+    Returns the requests to send and the indices of the requests that were folded away.
+    """
+    merged: List[dict] = []
+    absorbed: Set[int] = set()
+    for i, request in enumerate(requests):
+        current = request.get('repeatCell')
+        previous = merged[-1].get('repeatCell') if merged else None
+        if (isinstance(current, dict) and isinstance(previous, dict)
+                and isinstance(current.get('range'), dict) and isinstance(previous.get('range'), dict)
+                and current.get('cell') == previous.get('cell')
+                and current.get('fields') == previous.get('fields')):
+            grid_range = _merged_range(previous['range'], current['range'])
+            if grid_range is not None:
+                merged[-1] = {'repeatCell': {**previous, 'range': grid_range}}
+                absorbed.add(i)
+                continue
+        merged.append(request)
+    return merged, absorbed
+
+
+async def _send_batch(spreadsheet_id: str, requests: List[dict]) -> List[dict]:
+    """Send requests in one batchUpdate call and return one reply per request."""
+    merged, absorbed = _merge_repeat_cells(requests)
+    result = await _execute(get_service().spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={'requests': merged},
+        fields='replies'
+    ))
+
+    if any(SHEET_STRUCTURE_REQUESTS.intersection(request) for request in requests):
+        _sheet_ids.pop(spreadsheet_id, None)
+
+    # repeatCell replies are empty, so folded-away requests get an empty reply too
+    sent_replies = iter(result.get('replies', []))
+    return [{} if i in absorbed else next(sent_replies, {}) for i in range(len(requests))]
+
+
+def _rejected_request(error: Exception) -> bool:
+    """Whether the API rejected the request itself, rather than failing or throttling it."""
+    return isinstance(error, HttpError) and 400 <= error.resp.status < 500 and error.resp.status != 429
+
+
+async def _flush_batch(spreadsheet_id: str):
+    """Send the requests queued for a spreadsheet and hand each caller its replies."""
+    await asyncio.sleep(BATCH_WINDOW_SECONDS)
+    pending = _pending_batches.pop(spreadsheet_id)
+    waiting = [(queued, future) for queued, future in pending if not future.done()]
+    requests = [request for queued, _ in pending for request in queued]
+
+    try:
+        replies = await _send_batch(spreadsheet_id, requests)
+    except Exception as e:
+        if len(waiting) > 1 and _rejected_request(e):
+            # One caller's bad request fails the whole atomic call; resend each caller's
+            # requests on their own, in order, so the error only reaches the caller who caused it
+            for queued, future in waiting:
+                if future.done():
+                    continue
+                try:
+                    own = await _send_batch(spreadsheet_id, queued)
+                except Exception as own_error:
+                    if not future.done():
+                        future.set_exception(own_error)
+                else:
+                    if not future.done():
+                        future.set_result(own)
+            return
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    offset = 0
+    for queued, future in pending:
+        own = replies[offset:offset + len(queued)]
+        offset += len(queued)
+        if not future.done():
+            future.set_result(own)
+
+
+# Sheets API color channel (0-1) for each byte value
+_BYTE_TO_UNIT = tuple(i / 255 for i in range(256))
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> dict:
+    """Convert a hex color (e.g., #FF0000) to a Sheets API color.
+
+    Cached because agents reuse a small palette; callers must not mutate the result.
+    """
+    rgb = bytes.fromhex(hex_color.lstrip('#'))
+    return {
+        'red': _BYTE_TO_UNIT[rgb[0]],
+        'green': _BYTE_TO_UNIT[rgb[1]],
+        'blue': _BYTE_TO_UNIT[rgb[2]]
+    }
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_file, SCOPES)
-            creds = flow.run_local_server(port=0)
 
-        os.makedirs(creds_dir, exist_ok=True)
-        with open(token_file, 'w') as token:
-            token.write(creds.to_json())
+def _grid_range(sheet_id: int, start_row: int, end_row: int, start_col: int, end_col: int) -> dict:
+    """Build a Sheets API GridRange from 0-based, end-exclusive row and column indices."""
+    return {
+        'sheetId': sheet_id,
+        'startRowIndex': start_row,
+        'endRowIndex': end_row,
+        'startColumnIndex': start_col,
+        'endColumnIndex': end_col
+    }
+
+
+# Accepted enum values, validated by pydantic before any API call is made.
+# Every chart type but PIE is a BasicChartType; PIE is sent as a pieChart spec.
+ChartType = Literal['COLUMN', 'BAR', 'LINE', 'PIE', 'SCATTER', 'AREA', 'COMBO', 'STEPPED_AREA']
+BorderStyle = Literal['SOLID', 'SOLID_MEDIUM', 'SOLID_THICK', 'DASHED', 'DOTTED', 'DOUBLE', 'NONE']
+MergeType = Literal['MERGE_ALL', 'MERGE_COLUMNS', 'MERGE_ROWS']
+ConditionType = Literal[
+    'NUMBER_GREATER', 'NUMBER_GREATER_THAN_EQ', 'NUMBER_LESS', 'NUMBER_LESS_THAN_EQ',
+    'NUMBER_EQ', 'NUMBER_NOT_EQ', 'NUMBER_BETWEEN', 'NUMBER_NOT_BETWEEN',
+    'TEXT_CONTAINS', 'TEXT_NOT_CONTAINS', 'TEXT_STARTS_WITH', 'TEXT_ENDS_WITH',
+    'TEXT_EQ', 'TEXT_NOT_EQ', 'TEXT_IS_EMAIL', 'TEXT_IS_URL',
+    'DATE_EQ', 'DATE_NOT_EQ', 'DATE_BEFORE', 'DATE_AFTER', 'DATE_ON_OR_BEFORE', 'DATE_ON_OR_AFTER',
+    'DATE_BETWEEN', 'DATE_NOT_BETWEEN', 'DATE_IS_VALID',
+    'ONE_OF_RANGE', 'ONE_OF_LIST', 'BLANK', 'NOT_BLANK', 'CUSTOM_FORMULA', 'BOOLEAN'
+]
+
+
+# Axes shared by every chart from sheets_add_chart; sent as-is, never mutated
+CHART_AXES = [{'position': 'BOTTOM_AXIS'}, {'position': 'LEFT_AXIS'}]
+
+
+# Every edge updated by sheets_add_borders
+BORDER_SIDES = ('top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical')
+
 
-    _creds = creds
-    return creds
+@lru_cache(maxsize=64)
+def _border_sides(style: str, color: str) -> dict:
+    """Build the per-side border spec for a style and color; callers must not mutate the result."""
+    return dict.fromkeys(BORDER_SIDES, {'style': style, 'color': _hex_to_rgb(color)})
+
+
+# Progress messages are only sent to the client when LOG_LEVEL allows INFO
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+INFO_ENABLED = LOG_LEVEL in ('DEBUG', 'INFO')
+
+
+async def _info(ctx: Optional[Context], message: str, *args) -> None:
+    """Send an info message to the client, formatting it only when it will be sent."""
+    if ctx and INFO_ENABLED:
+        await ctx.info(message % args if args else message)
+
+
+mcp = FastMCP("Google Sheets", lifespan=lifespan)
 
 
 # ============================================================================
@@ -85,13 +560,11 @@ async def sheets_create(
     title: Annotated[str, Field(description="Title of the new spreadsheet")],
     sheet_titles: Annotated[Optional[List[str]], Field(description="Optional list of sheet names to create")] = None,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Create a new spreadsheet"""
-    if ctx:
-        await ctx.info(f"Creating spreadsheet: {title}")
+    await _info(ctx, "Creating spreadsheet: %s", title)
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
     if not sheet_titles:
         sheet_titles = ["Sheet1"]
@@ -101,15 +574,16 @@ async def sheets_create(
         'sheets': [{'properties': {'title': sheet}} for sheet in sheet_titles]
     }
 
-    result = service.spreadsheets().create(body=spreadsheet).execute()
+    result = await _execute(service.spreadsheets().create(
+        body=spreadsheet, fields='spreadsheetId,spreadsheetUrl'
+    ))
 
-    if ctx:
-        await ctx.info(f"Created spreadsheet: {result['spreadsheetId']}")
+    await _info(ctx, "Created spreadsheet: %s", result['spreadsheetId'])
 
-    return json.dumps({
+    return {
         'spreadsheetId': result['spreadsheetId'],
         'spreadsheetUrl': result['spreadsheetUrl']
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -117,17 +591,15 @@ async def sheets_read(
     spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
     range: Annotated[str, Field(description="A1 notation range (e.g., 'Sheet1!A1:B10')")],
     ctx: Context = None
-) -> str:
+) -> List[List[Any]]:
     """Read data from a range"""
-    if ctx:
-        await ctx.info(f"Reading range: {range}")
+    await _info(ctx, "Reading range: %s", range)
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-    result = service.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id, range=range
-    ).execute()
-    return json.dumps(result.get('values', []), indent=2)
+    service = get_service()
+    result = await _execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=range, fields='values', prettyPrint=False
+    ))
+    return result.get('values', [])
 
 
 @mcp.tool()
@@ -136,22 +608,24 @@ async def sheets_write(
     range: Annotated[str, Field(description="A1 notation range (e.g., 'Sheet1!A1')")],
     values: Annotated[List[List[str]], Field(description="2D array of values to write (supports formulas like =SUM(A1:A10))")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Write data (supports formulas like =SUM(A1:A10))"""
-    if ctx:
-        await ctx.info(f"Writing to range: {range}")
+    await _info(ctx, "Writing to range: %s", range)
+
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return {'error': f'A batch is open for {spreadsheet_id}; commit or discard it before writing values'}
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
-    result = service.spreadsheets().values().update(
+    result = await _execute(service.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
         range=range,
         valueInputOption='USER_ENTERED',
-        body={'values': values}
-    ).execute()
+        body={'values': values},
+        fields='updatedCells'
+    ))
 
-    return json.dumps({'updatedCells': result.get('updatedCells')}, indent=2)
+    return {'updatedCells': result.get('updatedCells')}
 
 
 @mcp.tool()
@@ -160,22 +634,73 @@ async def sheets_append(
     range: Annotated[str, Field(description="A1 notation range to append to")],
     values: Annotated[List[List[str]], Field(description="2D array of values to append")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Append rows to end of sheet"""
-    if ctx:
-        await ctx.info(f"Appending to range: {range}")
+    await _info(ctx, "Appending to range: %s", range)
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return {'error': f'A batch is open for {spreadsheet_id}; commit or discard it before appending values'}
 
-    result = service.spreadsheets().values().append(
+    service = get_service()
+
+    result = await _execute(service.spreadsheets().values().append(
         spreadsheetId=spreadsheet_id,
         range=range,
         valueInputOption='USER_ENTERED',
-        body={'values': values}
-    ).execute()
+        body={'values': values},
+        fields='updates.updatedCells'
+    ))
+
+    return {'updatedCells': result.get('updates', {}).get('updatedCells')}
+
+
+@mcp.tool()
+async def sheets_read_many(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    ranges: Annotated[List[str], Field(description="A1 notation ranges to read (e.g., ['Sheet1!A1:B10', 'Sheet2!A:A'])")],
+    ctx: Context = None
+) -> List[Dict[str, Any]]:
+    """Read data from several ranges in a single request"""
+    await _info(ctx, "Reading %s range(s)", len(ranges))
+
+    service = get_service()
+    result = await _execute(service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=ranges,
+        fields='valueRanges(range,values)',
+        prettyPrint=False
+    ))
+
+    return [
+        {'range': value_range.get('range'), 'values': value_range.get('values', [])}
+        for value_range in result.get('valueRanges', [])
+    ]
+
+
+@mcp.tool()
+async def sheets_write_many(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    data: Annotated[List[Dict[str, Any]], Field(description="List of {'range': A1 range, 'values': 2D array} objects to write (supports formulas)")],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Write data to several ranges in a single request (supports formulas)"""
+    await _info(ctx, "Writing to %s range(s)", len(data))
+
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return {'error': f'A batch is open for {spreadsheet_id}; commit or discard it before writing values'}
 
-    return json.dumps({'updatedCells': result.get('updates', {}).get('updatedCells')}, indent=2)
+    service = get_service()
+
+    result = await _execute(service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={'valueInputOption': 'USER_ENTERED', 'data': data},
+        fields='totalUpdatedCells,totalUpdatedRanges'
+    ))
+
+    return {
+        'updatedCells': result.get('totalUpdatedCells'),
+        'updatedRanges': result.get('totalUpdatedRanges')
+    }
 
 
 @mcp.tool()
@@ -183,24 +708,19 @@ async def sheets_get_sheet_id(
     spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
     sheet_name: Annotated[str, Field(description="Name of the sheet to find")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Get the sheet ID for a given sheet name (needed for delete/insert operations)"""
-    if ctx:
-        await ctx.info(f"Getting sheet ID for: {sheet_name}")
+    await _info(ctx, "Getting sheet ID for: %s", sheet_name)
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    sheet_id = await _lookup_sheet_id(spreadsheet_id, sheet_name)
 
-    spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    if sheet_id is None:
+        return {'error': f'Sheet "{sheet_name}" not found'}
 
-    for sheet in spreadsheet.get('sheets', []):
-        if sheet['properties']['title'] == sheet_name:
-            return json.dumps({
-                'sheetId': sheet['properties']['sheetId'],
-                'sheetName': sheet_name
-            }, indent=2)
-
-    return json.dumps({'error': f'Sheet "{sheet_name}" not found'}, indent=2)
+    return {
+        'sheetId': sheet_id,
+        'sheetName': sheet_name
+    }
 
 
 @mcp.tool()
@@ -210,13 +730,9 @@ async def sheets_delete_rows(
     start_row: Annotated[int, Field(description="Start row index (0-based, row 2 in UI = index 1)", ge=0)],
     end_row: Annotated[int, Field(description="End row index (exclusive)", ge=1)],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Delete rows from sheet. Row indices are 0-based."""
-    if ctx:
-        await ctx.info(f"Deleting rows {start_row} to {end_row}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Deleting rows %s to %s", start_row, end_row)
 
     requests = [{
         'deleteDimension': {
@@ -229,17 +745,17 @@ async def sheets_delete_rows(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    await _batch_update(spreadsheet_id, requests)
 
     deleted_count = end_row - start_row
-    return json.dumps({
+    return {
         'success': True,
         'deletedRows': deleted_count,
         'message': f'Deleted {deleted_count} row(s)'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -249,13 +765,9 @@ async def sheets_insert_rows(
     start_row: Annotated[int, Field(description="Row index to insert at (0-based)", ge=0)],
     num_rows: Annotated[int, Field(description="Number of rows to insert", ge=1)] = 1,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Insert blank rows into sheet. Row indices are 0-based."""
-    if ctx:
-        await ctx.info(f"Inserting {num_rows} row(s) at index {start_row}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Inserting %s row(s) at index %s", num_rows, start_row)
 
     requests = [{
         'insertDimension': {
@@ -269,16 +781,16 @@ async def sheets_insert_rows(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    return json.dumps({
+    await _batch_update(spreadsheet_id, requests)
+
+    return {
         'success': True,
         'insertedRows': num_rows,
         'message': f'Inserted {num_rows} row(s) at row {start_row + 1}'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -286,23 +798,25 @@ async def sheets_clear_range(
     spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
     range: Annotated[str, Field(description="A1 notation range to clear (e.g., 'Sheet1!A1:B10')")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Clear values from a range (keeps formatting)."""
-    if ctx:
-        await ctx.info(f"Clearing range: {range}")
+    await _info(ctx, "Clearing range: %s", range)
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return {'error': f'A batch is open for {spreadsheet_id}; commit or discard it before clearing values'}
 
-    service.spreadsheets().values().clear(
+    service = get_service()
+
+    await _execute(service.spreadsheets().values().clear(
         spreadsheetId=spreadsheet_id,
-        range=range
-    ).execute()
+        range=range,
+        fields='clearedRange'
+    ))
 
-    return json.dumps({
+    return {
         'success': True,
         'message': f'Cleared range: {range}'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -314,13 +828,19 @@ async def sheets_find_replace(
     match_case: Annotated[bool, Field(description="Case-sensitive matching")] = False,
     match_entire_cell: Annotated[bool, Field(description="Match entire cell contents only")] = False,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Find and replace text across sheet(s)."""
-    if ctx:
-        await ctx.info(f"Finding '{find}' and replacing with '{replacement}'")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Finding '%s' and replacing with '%s'", find, replacement)
+
+    # Nothing can change, so skip the API call and the write quota it costs.
+    # Case-insensitive matches may still rewrite case, so only exact matches qualify.
+    if not find or (find == replacement and match_case):
+        return {
+            'success': True,
+            'replacements': 0,
+            'skipped': True,
+            'message': 'Replaced 0 occurrence(s)'
+        }
 
     find_replace_spec = {
         'find': find,
@@ -334,18 +854,18 @@ async def sheets_find_replace(
 
     requests = [{'findReplace': find_replace_spec}]
 
-    result = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    occurrences = result.get('replies', [{}])[0].get('findReplace', {}).get('occurrencesChanged', 0)
+    replies = await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({
+    occurrences = replies[0].get('findReplace', {}).get('occurrencesChanged', 0)
+
+    return {
         'success': True,
         'replacements': occurrences,
         'message': f'Replaced {occurrences} occurrence(s)'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -354,13 +874,9 @@ async def sheets_duplicate_sheet(
     source_sheet_id: Annotated[int, Field(description="Sheet ID to duplicate")],
     new_sheet_name: Annotated[str, Field(description="Name for the new duplicated sheet")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Duplicate an entire sheet within the same spreadsheet."""
-    if ctx:
-        await ctx.info(f"Duplicating sheet to: {new_sheet_name}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Duplicating sheet to: %s", new_sheet_name)
 
     requests = [{
         'duplicateSheet': {
@@ -369,19 +885,19 @@ async def sheets_duplicate_sheet(
         }
     }]
 
-    result = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    new_sheet = result.get('replies', [{}])[0].get('duplicateSheet', {}).get('properties', {})
+    replies = await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({
+    new_sheet = replies[0].get('duplicateSheet', {}).get('properties', {})
+
+    return {
         'success': True,
         'newSheetId': new_sheet.get('sheetId'),
         'newSheetName': new_sheet.get('title'),
         'message': f'Duplicated sheet to "{new_sheet_name}"'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -394,22 +910,12 @@ async def sheets_delete_duplicates(
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
     comparison_columns: Annotated[Optional[List[int]], Field(description="Column indices to check for duplicates")] = None,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Delete duplicate rows based on column values."""
-    if ctx:
-        await ctx.info("Deleting duplicate rows")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Deleting duplicate rows")
 
     delete_duplicates_spec = {
-        'range': {
-            'sheetId': sheet_id,
-            'startRowIndex': start_row,
-            'endRowIndex': end_row,
-            'startColumnIndex': start_col,
-            'endColumnIndex': end_col
-        }
+        'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col)
     }
 
     if comparison_columns:
@@ -420,18 +926,18 @@ async def sheets_delete_duplicates(
 
     requests = [{'deleteDuplicates': delete_duplicates_spec}]
 
-    result = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    replies = await _batch_update(spreadsheet_id, requests)
 
-    duplicates = result.get('replies', [{}])[0].get('deleteDuplicates', {}).get('duplicatesRemovedCount', 0)
+    duplicates = replies[0].get('deleteDuplicates', {}).get('duplicatesRemovedCount', 0)
 
-    return json.dumps({
+    return {
         'success': True,
         'duplicatesRemoved': duplicates,
         'message': f'Removed {duplicates} duplicate row(s)'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -443,38 +949,28 @@ async def sheets_trim_whitespace(
     start_col: Annotated[int, Field(description="Start column index (0-based)", ge=0)],
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Trim leading/trailing whitespace from all cells in range."""
-    if ctx:
-        await ctx.info("Trimming whitespace from cells")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Trimming whitespace from cells")
 
     requests = [{
         'trimWhitespace': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            }
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col)
         }
     }]
 
-    result = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    cells_trimmed = result.get('replies', [{}])[0].get('trimWhitespace', {}).get('cellsChangedCount', 0)
+    replies = await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({
+    cells_trimmed = replies[0].get('trimWhitespace', {}).get('cellsChangedCount', 0)
+
+    return {
         'success': True,
         'cellsTrimmed': cells_trimmed,
         'message': f'Trimmed whitespace from {cells_trimmed} cell(s)'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -485,38 +981,28 @@ async def sheets_merge_cells(
     end_row: Annotated[int, Field(description="End row index (exclusive)", ge=1)],
     start_col: Annotated[int, Field(description="Start column index (0-based)", ge=0)],
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
-    merge_type: Annotated[str, Field(description="Merge type: MERGE_ALL, MERGE_COLUMNS, or MERGE_ROWS")] = 'MERGE_ALL',
+    merge_type: Annotated[MergeType, Field(description="Merge type: MERGE_ALL, MERGE_COLUMNS, or MERGE_ROWS")] = 'MERGE_ALL',
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Merge cells in range."""
-    if ctx:
-        await ctx.info(f"Merging cells with type: {merge_type}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Merging cells with type: %s", merge_type)
 
     requests = [{
         'mergeCells': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            },
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col),
             'mergeType': merge_type
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({
+    return {
         'success': True,
         'message': f'Merged cells with type: {merge_type}'
-    }, indent=2)
+    }
 
 
 @mcp.tool()
@@ -532,23 +1018,13 @@ async def sheets_copy_paste(
     dest_start_col: Annotated[int, Field(description="Destination start column (0-based)", ge=0)],
     paste_type: Annotated[str, Field(description="Paste type: NORMAL, VALUES, FORMAT, FORMULA")] = 'NORMAL',
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Copy and paste range."""
-    if ctx:
-        await ctx.info(f"Copying range with paste type: {paste_type}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Copying range with paste type: %s", paste_type)
 
     requests = [{
         'copyPaste': {
-            'source': {
-                'sheetId': source_sheet_id,
-                'startRowIndex': source_start_row,
-                'endRowIndex': source_end_row,
-                'startColumnIndex': source_start_col,
-                'endColumnIndex': source_end_col
-            },
+            'source': _grid_range(source_sheet_id, source_start_row, source_end_row, source_start_col, source_end_col),
             'destination': {
                 'sheetId': dest_sheet_id,
                 'startRowIndex': dest_start_row,
@@ -558,15 +1034,15 @@ async def sheets_copy_paste(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    return json.dumps({
+    await _batch_update(spreadsheet_id, requests)
+
+    return {
         'success': True,
         'message': f'Copied range with paste type: {paste_type}'
-    }, indent=2)
+    }
 
 
 # ============================================================================
@@ -587,13 +1063,9 @@ async def sheets_format_cells(
     bg_color: Annotated[Optional[str], Field(description="Background color as hex (e.g., #FF0000)")] = None,
     text_color: Annotated[Optional[str], Field(description="Text color as hex (e.g., #000000)")] = None,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Format cells (bold, italic, font size, colors)."""
-    if ctx:
-        await ctx.info("Formatting cells")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Formatting cells")
 
     cell_format = {}
     text_format = {}
@@ -606,38 +1078,28 @@ async def sheets_format_cells(
         text_format['fontSize'] = font_size
 
     if text_color:
-        color = text_color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) / 255 for i in (0, 2, 4))
-        text_format['foregroundColor'] = {'red': r, 'green': g, 'blue': b}
+        text_format['foregroundColor'] = _hex_to_rgb(text_color)
 
     if text_format:
         cell_format['textFormat'] = text_format
 
     if bg_color:
-        color = bg_color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) / 255 for i in (0, 2, 4))
-        cell_format['backgroundColor'] = {'red': r, 'green': g, 'blue': b}
+        cell_format['backgroundColor'] = _hex_to_rgb(bg_color)
 
     requests = [{
         'repeatCell': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            },
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col),
             'cell': {'userEnteredFormat': cell_format},
             'fields': 'userEnteredFormat'
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({'success': True}, indent=2)
+    return {'success': True}
 
 
 @mcp.tool()
@@ -648,49 +1110,26 @@ async def sheets_add_borders(
     end_row: Annotated[int, Field(description="End row index (exclusive)", ge=1)],
     start_col: Annotated[int, Field(description="Start column index (0-based)", ge=0)],
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
-    style: Annotated[str, Field(description="Border style: SOLID, DASHED, DOTTED")] = "SOLID",
+    style: Annotated[BorderStyle, Field(description="Border style: SOLID, SOLID_MEDIUM, SOLID_THICK, DASHED, DOTTED, DOUBLE or NONE")] = "SOLID",
     color: Annotated[str, Field(description="Border color as hex (e.g., #000000)")] = "#000000",
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Add borders to cells."""
-    if ctx:
-        await ctx.info(f"Adding {style} borders")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-
-    hex_color = color.lstrip('#')
-    r, g, b = tuple(int(hex_color[i:i+2], 16) / 255 for i in (0, 2, 4))
-
-    border_style = {
-        'style': style,
-        'color': {'red': r, 'green': g, 'blue': b}
-    }
+    await _info(ctx, "Adding %s borders", style)
 
     requests = [{
         'updateBorders': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            },
-            'top': border_style,
-            'bottom': border_style,
-            'left': border_style,
-            'right': border_style,
-            'innerHorizontal': border_style,
-            'innerVertical': border_style
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+            **_border_sides(style, color)
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    return json.dumps({'success': True}, indent=2)
+    await _batch_update(spreadsheet_id, requests)
+
+    return {'success': True}
 
 
 # ============================================================================
@@ -701,48 +1140,51 @@ async def sheets_add_borders(
 async def sheets_add_chart(
     spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
     sheet_id: Annotated[int, Field(description="The sheet ID")],
-    chart_type: Annotated[str, Field(description="Chart type: COLUMN, BAR, LINE, PIE, SCATTER")],
+    chart_type: Annotated[ChartType, Field(description="Chart type: COLUMN, BAR, LINE, AREA, SCATTER, COMBO, STEPPED_AREA or PIE")],
     data_range: Annotated[str, Field(description="Data range in A1 notation (e.g., 'Sheet1!A1:B10')")],
     title: Annotated[str, Field(description="Chart title")],
     row: Annotated[int, Field(description="Anchor row for chart position", ge=0)] = 0,
     col: Annotated[int, Field(description="Anchor column for chart position", ge=0)] = 0,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Add a chart."""
-    if ctx:
-        await ctx.info(f"Adding {chart_type} chart: {title}")
+    await _info(ctx, "Adding %s chart: %s", chart_type, title)
+
+    domain = {
+        'sourceRange': {
+            'sources': [{'sheetId': sheet_id, 'startRowIndex': 0, 'startColumnIndex': 0}]
+        }
+    }
+    series = {
+        'sourceRange': {
+            'sources': [{'sheetId': sheet_id}]
+        }
+    }
 
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    # Pie charts have no axes and take a single domain and series
+    if chart_type == 'PIE':
+        spec = {
+            'pieChart': {
+                'legendPosition': 'RIGHT_LEGEND',
+                'domain': domain,
+                'series': series
+            }
+        }
+    else:
+        spec = {
+            'basicChart': {
+                'chartType': chart_type,
+                'legendPosition': 'RIGHT_LEGEND',
+                'axis': CHART_AXES,
+                'domains': [{'domain': domain}],
+                'series': [{'series': series}]
+            }
+        }
 
     requests = [{
         'addChart': {
             'chart': {
-                'spec': {
-                    'title': title,
-                    'basicChart': {
-                        'chartType': chart_type,
-                        'legendPosition': 'RIGHT_LEGEND',
-                        'axis': [
-                            {'position': 'BOTTOM_AXIS'},
-                            {'position': 'LEFT_AXIS'}
-                        ],
-                        'domains': [{
-                            'domain': {
-                                'sourceRange': {
-                                    'sources': [{'sheetId': sheet_id, 'startRowIndex': 0, 'startColumnIndex': 0}]
-                                }
-                            }
-                        }],
-                        'series': [{
-                            'series': {
-                                'sourceRange': {
-                                    'sources': [{'sheetId': sheet_id}]
-                                }
-                            }
-                        }]
-                    }
-                },
+                'spec': {'title': title, **spec},
                 'position': {
                     'overlayPosition': {
                         'anchorCell': {
@@ -756,12 +1198,17 @@ async def sheets_add_chart(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    replies = await _batch_update(spreadsheet_id, requests)
 
-    return json.dumps({'success': True}, indent=2)
+    chart_id = replies[0].get('addChart', {}).get('chart', {}).get('chartId')
+
+    return {
+        'success': True,
+        'chartId': chart_id
+    }
 
 
 # ============================================================================
@@ -778,23 +1225,13 @@ async def sheets_add_dropdown(
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
     values: Annotated[List[str], Field(description="List of dropdown options")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Add dropdown list validation to cells"""
-    if ctx:
-        await ctx.info(f"Adding dropdown with {len(values)} options")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Adding dropdown with %s options", len(values))
 
     requests = [{
         'setDataValidation': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            },
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col),
             'rule': {
                 'condition': {
                     'type': 'ONE_OF_LIST',
@@ -805,12 +1242,12 @@ async def sheets_add_dropdown(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    return json.dumps({'success': True}, indent=2)
+    await _batch_update(spreadsheet_id, requests)
+
+    return {'success': True}
 
 
 @mcp.tool()
@@ -821,38 +1258,25 @@ async def sheets_conditional_format(
     end_row: Annotated[int, Field(description="End row index (exclusive)", ge=1)],
     start_col: Annotated[int, Field(description="Start column index (0-based)", ge=0)],
     end_col: Annotated[int, Field(description="End column index (exclusive)", ge=1)],
-    condition_type: Annotated[str, Field(description="Condition type: NUMBER_GREATER, NUMBER_LESS, TEXT_CONTAINS, etc.")],
+    condition_type: Annotated[ConditionType, Field(description="Condition type: NUMBER_GREATER, NUMBER_LESS, TEXT_CONTAINS, etc.")],
     condition_value: Annotated[str, Field(description="Value to compare against")],
     bg_color: Annotated[str, Field(description="Background color as hex (e.g., #00FF00)")],
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Add conditional formatting."""
-    if ctx:
-        await ctx.info(f"Adding conditional format: {condition_type} {condition_value}")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-
-    hex_color = bg_color.lstrip('#')
-    r, g, b = tuple(int(hex_color[i:i+2], 16) / 255 for i in (0, 2, 4))
+    await _info(ctx, "Adding conditional format: %s %s", condition_type, condition_value)
 
     requests = [{
         'addConditionalFormatRule': {
             'rule': {
-                'ranges': [{
-                    'sheetId': sheet_id,
-                    'startRowIndex': start_row,
-                    'endRowIndex': end_row,
-                    'startColumnIndex': start_col,
-                    'endColumnIndex': end_col
-                }],
+                'ranges': [_grid_range(sheet_id, start_row, end_row, start_col, end_col)],
                 'booleanRule': {
                     'condition': {
                         'type': condition_type,
                         'values': [{'userEnteredValue': condition_value}]
                     },
                     'format': {
-                        'backgroundColor': {'red': r, 'green': g, 'blue': b}
+                        'backgroundColor': _hex_to_rgb(bg_color)
                     }
                 }
             },
@@ -860,12 +1284,12 @@ async def sheets_conditional_format(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
 
-    return json.dumps({'success': True}, indent=2)
+    await _batch_update(spreadsheet_id, requests)
+
+    return {'success': True}
 
 
 # ============================================================================
@@ -883,23 +1307,13 @@ async def sheets_sort_range(
     sort_column: Annotated[int, Field(description="Column index to sort by (0-based)", ge=0)],
     ascending: Annotated[bool, Field(description="Sort in ascending order")] = True,
     ctx: Context = None
-) -> str:
+) -> Dict[str, Any]:
     """Sort a range by a column"""
-    if ctx:
-        await ctx.info(f"Sorting by column {sort_column} ({'ascending' if ascending else 'descending'})")
-
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    await _info(ctx, "Sorting by column %s (%s)", sort_column, 'ascending' if ascending else 'descending')
 
     requests = [{
         'sortRange': {
-            'range': {
-                'sheetId': sheet_id,
-                'startRowIndex': start_row,
-                'endRowIndex': end_row,
-                'startColumnIndex': start_col,
-                'endColumnIndex': end_col
-            },
+            'range': _grid_range(sheet_id, start_row, end_row, start_col, end_col),
             'sortSpecs': [{
                 'dimensionIndex': sort_column,
                 'sortOrder': 'ASCENDING' if ascending else 'DESCENDING'
@@ -907,12 +1321,116 @@ async def sheets_sort_range(
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    await _batch_update(spreadsheet_id, requests)
+
+    return {'success': True}
+
+
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+@mcp.tool()
+async def sheets_batch_update(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    requests: Annotated[List[Dict[str, Any]], Field(description="Sheets API batchUpdate requests (e.g., [{'repeatCell': {...}}, {'sortRange': {...}}])", min_length=1)],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Apply several raw batchUpdate requests in one atomic API call"""
+    await _info(ctx, "Applying %s batch request(s)", len(requests))
+
+    # Each Sheets API Request holds exactly one kind (repeatCell, sortRange, ...)
+    invalid = [i for i, request in enumerate(requests) if len(request) != 1]
+    if invalid:
+        return {'error': f'Requests at index {invalid} must each contain exactly one request type'}
+
+    if _batch_key(ctx, spreadsheet_id) in _open_batches:
+        return _hold(ctx, spreadsheet_id, requests)
+
+    replies = await _batch_update(spreadsheet_id, requests)
+
+    return {
+        'success': True,
+        'replies': replies
+    }
 
-    return json.dumps({'success': True}, indent=2)
+
+@mcp.tool()
+async def sheets_begin_batch(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Start holding this session's edits to a spreadsheet so they are sent together by sheets_commit_batch.
+
+    While the batch is open, editing tools return {'held': True} instead of applying the edit;
+    edits from other client sessions are not held. sheets_write, sheets_append, sheets_write_many
+    and sheets_clear_range cannot be held and are refused until the batch is committed or discarded,
+    so they can't land ahead of held structural edits.
+    the real replies are returned by sheets_commit_batch. Use sheets_discard_batch to drop them.
+    """
+    await _info(ctx, "Starting batch for: %s", spreadsheet_id)
+
+    key = _batch_key(ctx, spreadsheet_id)
+    if key is None:
+        return {'error': 'Batch mode needs a client session; this connection is stateless, use sheets_batch_update instead'}
+
+    _open_batches.setdefault(key, [])
+
+    return {
+        'success': True,
+        'message': f'Batch started for {spreadsheet_id}'
+    }
+
+
+@mcp.tool()
+async def sheets_commit_batch(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Send all edits held since sheets_begin_batch in one atomic API call"""
+    key = _batch_key(ctx, spreadsheet_id)
+    held = _open_batches.pop(key, None)
+
+    if held is None:
+        return {'error': f'No batch started for {spreadsheet_id}'}
+
+    await _info(ctx, "Committing %s batch request(s)", len(held))
+
+    try:
+        replies = await _batch_update(spreadsheet_id, held) if held else []
+    except HttpError as e:
+        # batchUpdate is atomic, so nothing was applied; keep the edits so the commit can be retried
+        _open_batches[key] = held + _open_batches.get(key, [])
+        return {'error': f'Commit failed and no held edit was applied; the batch is still open with {len(held)} request(s): {e}'}
+
+    return {
+        'success': True,
+        'requestCount': len(held),
+        'replies': replies
+    }
+
+
+@mcp.tool()
+async def sheets_discard_batch(
+    spreadsheet_id: Annotated[str, Field(description="The spreadsheet ID")],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Drop all edits held since sheets_begin_batch without sending them"""
+    held = _open_batches.pop(_batch_key(ctx, spreadsheet_id), None)
+
+    if held is None:
+        return {'error': f'No batch started for {spreadsheet_id}'}
+
+    await _info(ctx, "Discarding %s batch request(s)", len(held))
+
+    return {
+        'success': True,
+        'discardedCount': len(held),
+        'message': f'Discarded {len(held)} held request(s) for {spreadsheet_id}'
+    }
 
 
 if __name__ == "__main__":
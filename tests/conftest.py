@@ -42,8 +42,18 @@ async def mcp_client(mock_credentials, mock_sheets_service):
     Patches get_credentials and Google API service to avoid
     actual API calls during testing.
     """
+    from src.server import _RateLimiter
+
+    # Fresh quota buckets and caches per test so earlier tests cannot throttle or leak into later ones.
+    # The batch window is zeroed so batchUpdate tools do not wait to coalesce in every test.
     with patch('src.server.get_credentials', return_value=mock_credentials), \
-         patch('src.server.build', return_value=mock_sheets_service):
+         patch('src.server.build', return_value=mock_sheets_service), \
+         patch('src.server._service', None), \
+         patch('src.server.BATCH_WINDOW_SECONDS', 0), \
+         patch('src.server._read_limiter', _RateLimiter(60)), \
+         patch('src.server._write_limiter', _RateLimiter(60)), \
+         patch.dict('src.server._sheet_ids', clear=True), \
+         patch.dict('src.server._open_batches', clear=True):
 
         # Import the mcp server after patching
         from src.server import mcp
@@ -53,18 +63,28 @@ async def mcp_client(mock_credentials, mock_sheets_service):
 
 
 @pytest.fixture
+async def session_client(mcp_client):
+    """In-memory client on the session-based protocol, which batch mode requires."""
+    from src.server import mcp
+
+    _, mock_sheets_service = mcp_client
+    async with Client(transport=mcp, mode="legacy") as client:
+        yield client, mock_sheets_service
+
+
+@pytest.fixture(scope="session")
 def sample_spreadsheet_id():
     """Sample spreadsheet ID for testing."""
     return "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sheet_id():
     """Sample sheet ID for testing."""
     return 0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_values():
     """Sample data values for testing."""
     return [
@@ -73,3 +93,9 @@ def sample_values():
         ["Bob", "25", "Los Angeles"],
         ["Charlie", "35", "Chicago"]
     ]
+
+
+@pytest.fixture(scope="session")
+def large_values():
+    """1000 x 100 grid of sample values, built once per test session."""
+    return [[f"Cell {i},{j}" for j in range(100)] for i in range(1000)]
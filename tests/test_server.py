@@ -1,13 +1,20 @@
 """
 Comprehensive tests for Google Sheets MCP Server.
 
-Tests all 20 tools with success cases, error handling, and edge cases.
+Tests all 26 tools with success cases, error handling, and edge cases.
 Uses FastMCP in-memory testing pattern with mocked Google API calls.
 """
 
 import pytest
+import asyncio
 import json
-from unittest.mock import MagicMock
+import threading
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import httplib2
+from fastmcp.exceptions import ToolError
+from googleapiclient.errors import HttpError
 
 
 # ============================================================================
@@ -32,10 +39,11 @@ class TestSheetsCreate:
             arguments={"title": "Test Spreadsheet"}
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert 'spreadsheetId' in result_data
         assert 'spreadsheetUrl' in result_data
         assert result_data['spreadsheetId'] == sample_spreadsheet_id
+        assert mock_service.spreadsheets().create.call_args.kwargs['fields'] == 'spreadsheetId,spreadsheetUrl'
 
     async def test_create_spreadsheet_with_multiple_sheets(self, mcp_client, sample_spreadsheet_id):
         """Test creating spreadsheet with multiple named sheets."""
@@ -54,7 +62,7 @@ class TestSheetsCreate:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['spreadsheetId'] == sample_spreadsheet_id
 
 
@@ -77,7 +85,7 @@ class TestSheetsRead:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert len(result_data) == 4
         assert result_data[0] == ["Name", "Age", "City"]
 
@@ -95,7 +103,7 @@ class TestSheetsRead:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data == []
 
 
@@ -119,7 +127,7 @@ class TestSheetsWrite:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['updatedCells'] == 12
 
     async def test_write_with_formula(self, mcp_client, sample_spreadsheet_id):
@@ -139,7 +147,7 @@ class TestSheetsWrite:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['updatedCells'] == 3
 
 
@@ -163,7 +171,7 @@ class TestSheetsAppend:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['updatedCells'] == 3
 
     async def test_append_multiple_rows(self, mcp_client, sample_spreadsheet_id):
@@ -186,10 +194,66 @@ class TestSheetsAppend:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['updatedCells'] == 6
 
 
+class TestSheetsReadMany:
+    """Tests for sheets_read_many tool."""
+
+    async def test_read_many_ranges(self, mcp_client, sample_spreadsheet_id, sample_values):
+        """Test reading several ranges in one request."""
+        client, mock_service = mcp_client
+
+        mock_service.spreadsheets().values().batchGet().execute.return_value = {
+            'valueRanges': [
+                {'range': 'Sheet1!A1:C4', 'values': sample_values},
+                {'range': 'Sheet2!A1:A2'}
+            ]
+        }
+
+        result = await client.call_tool(
+            name="sheets_read_many",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "ranges": ["Sheet1!A1:C4", "Sheet2!A1:A2"]
+            }
+        )
+
+        result_data = result.data
+        assert len(result_data) == 2
+        assert result_data[0] == {'range': 'Sheet1!A1:C4', 'values': sample_values}
+        assert result_data[1]['values'] == []
+
+
+class TestSheetsWriteMany:
+    """Tests for sheets_write_many tool."""
+
+    async def test_write_many_ranges(self, mcp_client, sample_spreadsheet_id, sample_values):
+        """Test writing several ranges in one request."""
+        client, mock_service = mcp_client
+
+        mock_service.spreadsheets().values().batchUpdate().execute.return_value = {
+            'totalUpdatedCells': 14,
+            'totalUpdatedRanges': 2
+        }
+
+        result = await client.call_tool(
+            name="sheets_write_many",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "data": [
+                    {"range": "Sheet1!A1:C4", "values": sample_values},
+                    {"range": "Sheet1!E1:E2", "values": [["=SUM(B2:B4)"], ["Total"]]}
+                ]
+            }
+        )
+
+        result_data = result.data
+        assert result_data['updatedCells'] == 14
+        assert result_data['updatedRanges'] == 2
+
+
 class TestSheetsGetSheetId:
     """Tests for sheets_get_sheet_id tool."""
 
@@ -212,7 +276,7 @@ class TestSheetsGetSheetId:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['sheetId'] == sample_sheet_id
         assert result_data['sheetName'] == "Sheet1"
 
@@ -234,10 +298,63 @@ class TestSheetsGetSheetId:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert 'error' in result_data
         assert 'not found' in result_data['error']
 
+    async def test_get_sheet_id_uses_cache(self, mcp_client, sample_spreadsheet_id):
+        """Test that repeated lookups on one spreadsheet fetch metadata once."""
+        client, mock_service = mcp_client
+
+        get = mock_service.spreadsheets().get
+        get.return_value.execute.return_value = {
+            'sheets': [
+                {'properties': {'title': 'Sheet1', 'sheetId': 0}},
+                {'properties': {'title': 'Sheet2', 'sheetId': 1}}
+            ]
+        }
+        get.reset_mock()
+
+        for sheet_name, sheet_id in [("Sheet1", 0), ("Sheet2", 1)]:
+            result = await client.call_tool(
+                name="sheets_get_sheet_id",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_name": sheet_name
+                }
+            )
+            assert result.data['sheetId'] == sheet_id
+
+        assert get.call_count == 1
+
+    async def test_sheet_rename_invalidates_cache(self, mcp_client, sample_spreadsheet_id):
+        """Test that a rename sent through sheets_batch_update drops the cached sheet IDs."""
+        client, mock_service = mcp_client
+
+        get = mock_service.spreadsheets().get
+        get.return_value.execute.return_value = {'sheets': [{'properties': {'title': 'Sheet1', 'sheetId': 0}}]}
+        mock_service.spreadsheets().batchUpdate.return_value.execute.return_value = {'replies': [{}]}
+        get.reset_mock()
+
+        lookup = {"spreadsheet_id": sample_spreadsheet_id, "sheet_name": "Sheet1"}
+        result = await client.call_tool(name="sheets_get_sheet_id", arguments=lookup)
+        assert result.data['sheetId'] == 0
+
+        await client.call_tool(
+            name="sheets_batch_update",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "requests": [{'updateSheetProperties': {
+                    'properties': {'sheetId': 0, 'title': 'Renamed'}, 'fields': 'title'
+                }}]
+            }
+        )
+        get.return_value.execute.return_value = {'sheets': [{'properties': {'title': 'Renamed', 'sheetId': 0}}]}
+
+        result = await client.call_tool(name="sheets_get_sheet_id", arguments=lookup)
+        assert 'not found' in result.data['error']
+        assert get.call_count == 2
+
 
 # ============================================================================
 # ROW/CELL OPERATIONS TESTS
@@ -262,7 +379,7 @@ class TestSheetsDeleteRows:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['deletedRows'] == 1
 
@@ -282,7 +399,7 @@ class TestSheetsDeleteRows:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['deletedRows'] == 4
 
@@ -305,7 +422,7 @@ class TestSheetsInsertRows:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['insertedRows'] == 1
 
@@ -325,7 +442,7 @@ class TestSheetsInsertRows:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['insertedRows'] == 10
 
@@ -347,7 +464,7 @@ class TestSheetsClearRange:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert "Sheet1!A1:C10" in result_data['message']
 
@@ -376,7 +493,7 @@ class TestSheetsFindReplace:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['replacements'] == 5
 
@@ -400,7 +517,7 @@ class TestSheetsFindReplace:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['replacements'] == 2
 
@@ -421,10 +538,34 @@ class TestSheetsFindReplace:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['replacements'] == 0
 
+    async def test_find_replace_noop_skips_api(self, mcp_client, sample_spreadsheet_id):
+        """Test that an empty or identical exact-case find does not call the API."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        for find, replacement in [("", "new"), ("same", "same")]:
+            result = await client.call_tool(
+                name="sheets_find_replace",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "find": find,
+                    "replacement": replacement,
+                    "match_case": True
+                }
+            )
+
+            result_data = result.data
+            assert result_data['replacements'] == 0
+            assert result_data['skipped'] is True
+
+        batch_update.assert_not_called()
+
 
 class TestSheetsDuplicateSheet:
     """Tests for sheets_duplicate_sheet tool."""
@@ -453,7 +594,7 @@ class TestSheetsDuplicateSheet:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['newSheetId'] == 123
         assert result_data['newSheetName'] == 'Sheet1 Copy'
@@ -482,7 +623,7 @@ class TestSheetsDeleteDuplicates:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['duplicatesRemoved'] == 3
 
@@ -507,7 +648,7 @@ class TestSheetsDeleteDuplicates:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['duplicatesRemoved'] == 5
 
@@ -535,7 +676,7 @@ class TestSheetsTrimWhitespace:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert result_data['cellsTrimmed'] == 15
 
@@ -561,7 +702,7 @@ class TestSheetsMergeCells:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert 'MERGE_ALL' in result_data['message']
 
@@ -585,7 +726,7 @@ class TestSheetsMergeCells:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert merge_type in result_data['message']
 
@@ -614,7 +755,7 @@ class TestSheetsCopyPaste:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert 'NORMAL' in result_data['message']
 
@@ -641,7 +782,7 @@ class TestSheetsCopyPaste:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
         assert paste_type in result_data['message']
 
@@ -672,7 +813,7 @@ class TestSheetsFormatCells:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
     async def test_format_multiple_options(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
@@ -698,7 +839,7 @@ class TestSheetsFormatCells:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
@@ -723,9 +864,13 @@ class TestSheetsAddBorders:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
+        border_request = mock_service.spreadsheets().batchUpdate.call_args.kwargs['body']['requests'][0]['updateBorders']
+        for side in ('top', 'bottom', 'left', 'right', 'innerHorizontal', 'innerVertical'):
+            assert border_request[side]['style'] == 'SOLID'
+
     @pytest.mark.parametrize("style", ["SOLID", "DASHED", "DOTTED"])
     async def test_border_styles(self, mcp_client, sample_spreadsheet_id, sample_sheet_id, style):
         """Test different border styles."""
@@ -747,7 +892,7 @@ class TestSheetsAddBorders:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
@@ -762,7 +907,9 @@ class TestSheetsAddChart:
         """Test adding a column chart."""
         client, mock_service = mcp_client
 
-        mock_service.spreadsheets().batchUpdate().execute.return_value = {}
+        mock_service.spreadsheets().batchUpdate().execute.return_value = {
+            'replies': [{'addChart': {'chart': {'chartId': 42}}}]
+        }
 
         result = await client.call_tool(
             name="sheets_add_chart",
@@ -775,10 +922,11 @@ class TestSheetsAddChart:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
+        assert result_data['chartId'] == 42
 
-    @pytest.mark.parametrize("chart_type", ["COLUMN", "BAR", "LINE", "PIE", "SCATTER"])
+    @pytest.mark.parametrize("chart_type", ["COLUMN", "BAR", "LINE", "AREA", "SCATTER", "COMBO", "STEPPED_AREA"])
     async def test_chart_types(self, mcp_client, sample_spreadsheet_id, sample_sheet_id, chart_type):
         """Test different chart types."""
         client, mock_service = mcp_client
@@ -796,8 +944,53 @@ class TestSheetsAddChart:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
+        spec = mock_service.spreadsheets().batchUpdate.call_args.kwargs['body']['requests'][0]['addChart']['chart']['spec']
+        assert spec['basicChart']['chartType'] == chart_type
+
+    async def test_pie_chart_uses_pie_spec(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that PIE, which is not a BasicChartType, is sent as a pieChart spec."""
+        client, mock_service = mcp_client
+
+        mock_service.spreadsheets().batchUpdate().execute.return_value = {}
+
+        await client.call_tool(
+            name="sheets_add_chart",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "sheet_id": sample_sheet_id,
+                "chart_type": "PIE",
+                "data_range": "Sheet1!A1:B10",
+                "title": "Share"
+            }
+        )
+
+        spec = mock_service.spreadsheets().batchUpdate.call_args.kwargs['body']['requests'][0]['addChart']['chart']['spec']
+        assert 'basicChart' not in spec
+        assert spec['title'] == 'Share'
+        assert spec['pieChart']['series']['sourceRange']['sources'] == [{'sheetId': sample_sheet_id}]
+
+    async def test_invalid_chart_type_rejected(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that an unknown chart type is rejected without calling the API."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with pytest.raises(ToolError):
+            await client.call_tool(
+                name="sheets_add_chart",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_id": sample_sheet_id,
+                    "chart_type": "HISTOGRAM_3D",
+                    "data_range": "Sheet1!A1:B10",
+                    "title": "Bad Chart"
+                }
+            )
+
+        batch_update.assert_not_called()
 
     async def test_add_chart_with_position(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
         """Test adding chart at specific position."""
@@ -818,7 +1011,7 @@ class TestSheetsAddChart:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
@@ -848,7 +1041,7 @@ class TestSheetsAddDropdown:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
     async def test_add_dropdown_many_options(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
@@ -872,7 +1065,7 @@ class TestSheetsAddDropdown:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
@@ -900,7 +1093,7 @@ class TestSheetsConditionalFormat:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
     @pytest.mark.parametrize("condition_type,value", [
@@ -929,7 +1122,7 @@ class TestSheetsConditionalFormat:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
@@ -956,7 +1149,7 @@ class TestSheetsSortRange:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
     async def test_sort_descending(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
@@ -979,10 +1172,339 @@ class TestSheetsSortRange:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['success'] is True
 
 
+# ============================================================================
+# BATCH OPERATIONS TESTS
+# ============================================================================
+
+class TestSheetsBatchUpdate:
+    """Tests for sheets_batch_update tool."""
+
+    async def test_batch_update_multiple_requests(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that several raw requests are sent in one call and replies are returned."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            'replies': [{}, {'findReplace': {'occurrencesChanged': 4}}]
+        }
+        batch_update.reset_mock()
+
+        requests = [
+            {'sortRange': {'range': {'sheetId': sample_sheet_id}, 'sortSpecs': [{'dimensionIndex': 0}]}},
+            {'findReplace': {'find': 'old', 'replacement': 'new', 'allSheets': True}}
+        ]
+
+        result = await client.call_tool(
+            name="sheets_batch_update",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "requests": requests
+            }
+        )
+
+        result_data = result.data
+        assert result_data['success'] is True
+        assert result_data['replies'][1]['findReplace']['occurrencesChanged'] == 4
+        assert batch_update.call_count == 1
+        assert batch_update.call_args.kwargs['body']['requests'] == requests
+
+    async def test_batch_update_rejects_malformed_requests(self, mcp_client, sample_spreadsheet_id):
+        """Test that requests without exactly one request type are rejected before calling the API."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        result = await client.call_tool(
+            name="sheets_batch_update",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "requests": [{'sortRange': {}}, {}, {'repeatCell': {}, 'sortRange': {}}]
+            }
+        )
+
+        result_data = result.data
+        assert 'error' in result_data
+        assert '[1, 2]' in result_data['error']
+        batch_update.assert_not_called()
+
+    async def test_batch_update_passes_malformed_repeat_cells_through(self, mcp_client, sample_spreadsheet_id):
+        """Test that repeatCell requests the merge step cannot read are sent unchanged instead of hanging."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {'replies': [{}, {}, {}]}
+        batch_update.reset_mock()
+
+        requests = [{'repeatCell': {'range': None}}, {'repeatCell': {'range': None}}, {'repeatCell': 'x'}]
+
+        result = await asyncio.wait_for(client.call_tool(
+            name="sheets_batch_update",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "requests": requests
+            }
+        ), timeout=5)
+
+        assert result.data['success'] is True
+        assert batch_update.call_args.kwargs['body']['requests'] == requests
+
+
+class TestSheetsBatchMode:
+    """Tests for sheets_begin_batch, sheets_commit_batch and sheets_discard_batch tools."""
+
+    async def test_held_edits_sent_in_one_call(self, session_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that edits made between begin and commit are sent in one batchUpdate."""
+        client, mock_service = session_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            'replies': [{}, {'findReplace': {'occurrencesChanged': 3}}]
+        }
+        batch_update.reset_mock()
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        await client.call_tool(
+            name="sheets_format_cells",
+            arguments={
+                "spreadsheet_id": sample_spreadsheet_id,
+                "sheet_id": sample_sheet_id,
+                "start_row": 0,
+                "end_row": 1,
+                "start_col": 0,
+                "end_col": 3,
+                "bold": True
+            }
+        )
+        held = await client.call_tool(
+            name="sheets_find_replace",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "old", "replacement": "new"}
+        )
+        assert held.data['held'] is True
+        assert held.data['heldCount'] == 2
+        assert 'success' not in held.data
+        batch_update.assert_not_called()
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+
+        result_data = result.data
+        assert result_data['success'] is True
+        assert result_data['requestCount'] == 2
+        assert result_data['replies'][1]['findReplace']['occurrencesChanged'] == 3
+        assert batch_update.call_count == 1
+
+    async def test_adjacent_formats_merged(self, session_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that identical formats on consecutive rows are sent as one repeatCell."""
+        client, mock_service = session_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {'replies': [{}, {}]}
+        batch_update.reset_mock()
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        for row, color in [(0, "#FFFF00"), (1, "#FFFF00"), (2, "#FFFF00"), (3, "#00FF00")]:
+            await client.call_tool(
+                name="sheets_format_cells",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_id": sample_sheet_id,
+                    "start_row": row,
+                    "end_row": row + 1,
+                    "start_col": 0,
+                    "end_col": 3,
+                    "bg_color": color
+                }
+            )
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+
+        sent = batch_update.call_args.kwargs['body']['requests']
+        assert len(sent) == 2
+        assert sent[0]['repeatCell']['range']['startRowIndex'] == 0
+        assert sent[0]['repeatCell']['range']['endRowIndex'] == 3
+        assert sent[1]['repeatCell']['range']['startRowIndex'] == 3
+        assert result.data['replies'] == [{}, {}, {}, {}]
+
+    async def test_discard_drops_held_edits(self, session_client, sample_spreadsheet_id):
+        """Test that discarding a batch closes it without sending the held edits."""
+        client, mock_service = session_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {'replies': [{}]}
+        batch_update.reset_mock()
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        await client.call_tool(
+            name="sheets_delete_rows",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "sheet_id": 0, "start_row": 1, "end_row": 4}
+        )
+
+        result = await client.call_tool(
+            name="sheets_discard_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        assert result.data['discardedCount'] == 1
+        batch_update.assert_not_called()
+
+        result = await client.call_tool(
+            name="sheets_delete_rows",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "sheet_id": 0, "start_row": 1, "end_row": 4}
+        )
+        assert result.data['success'] is True
+        assert batch_update.call_count == 1
+
+    async def test_value_writes_refused_while_open(self, session_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test that value tools, which cannot be held, are refused instead of landing before held edits."""
+        client, mock_service = session_client
+
+        update = mock_service.spreadsheets().values().update
+        update.reset_mock()
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        held = await client.call_tool(
+            name="sheets_insert_rows",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "sheet_id": sample_sheet_id, "start_row": 0, "num_rows": 1}
+        )
+        assert held.data['held'] is True
+
+        result = await client.call_tool(
+            name="sheets_write",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "range": "Sheet1!A1", "values": [["x"]]}
+        )
+
+        assert 'error' in result.data
+        update.assert_not_called()
+
+    async def test_full_batch_refuses_more_edits(self, session_client, sample_spreadsheet_id, monkeypatch):
+        """Test that an open batch stops accepting edits once it holds MAX_HELD_REQUESTS."""
+        from src import server
+        client, mock_service = session_client
+        monkeypatch.setattr(server, 'MAX_HELD_REQUESTS', 1)
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        arguments = {"spreadsheet_id": sample_spreadsheet_id, "find": "old", "replacement": "new"}
+        first = await client.call_tool(name="sheets_find_replace", arguments=arguments)
+        second = await client.call_tool(name="sheets_find_replace", arguments=arguments)
+
+        assert first.data['held'] is True
+        assert 'error' in second.data
+
+    async def test_batch_is_scoped_to_the_session(self, session_client, sample_spreadsheet_id):
+        """Test that another client's edits are sent straight away and cannot touch the open batch."""
+        from fastmcp.client import Client
+        from src.server import mcp
+        client, mock_service = session_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {'replies': [{}]}
+        batch_update.reset_mock()
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+
+        async with Client(transport=mcp, mode="legacy") as other:
+            result = await other.call_tool(
+                name="sheets_find_replace",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "old", "replacement": "new"}
+            )
+            assert 'held' not in result.data
+            assert batch_update.call_count == 1
+
+            result = await other.call_tool(
+                name="sheets_discard_batch",
+                arguments={"spreadsheet_id": sample_spreadsheet_id}
+            )
+            assert 'error' in result.data
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        assert result.data['requestCount'] == 0
+
+    async def test_begin_refused_without_session(self, mcp_client, sample_spreadsheet_id):
+        """Test that a stateless connection cannot open a batch, so its edits are never silently held."""
+        client, mock_service = mcp_client
+
+        result = await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+
+        assert 'error' in result.data
+
+    async def test_failed_commit_keeps_batch_open(self, session_client, sample_spreadsheet_id):
+        """Test that a rejected commit keeps the held edits so it can be retried."""
+        client, mock_service = session_client
+
+        execute = mock_service.spreadsheets().batchUpdate.return_value.execute
+        execute.side_effect = HttpError(httplib2.Response({'status': 400}), b'')
+
+        await client.call_tool(
+            name="sheets_begin_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        await client.call_tool(
+            name="sheets_find_replace",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "old", "replacement": "new"}
+        )
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        assert 'still open' in result.data['error']
+
+        execute.side_effect = None
+        execute.return_value = {'replies': [{'findReplace': {'occurrencesChanged': 2}}]}
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+        assert result.data['requestCount'] == 1
+        assert result.data['replies'][0]['findReplace']['occurrencesChanged'] == 2
+
+    async def test_commit_without_begin(self, session_client, sample_spreadsheet_id):
+        """Test committing when no batch was started."""
+        client, mock_service = session_client
+
+        result = await client.call_tool(
+            name="sheets_commit_batch",
+            arguments={"spreadsheet_id": sample_spreadsheet_id}
+        )
+
+        result_data = result.data
+        assert 'error' in result_data
+
+
 # ============================================================================
 # EDGE CASE AND ERROR HANDLING TESTS
 # ============================================================================
@@ -1007,17 +1529,15 @@ class TestEdgeCases:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert 'updatedCells' in result_data
 
-    async def test_large_range_read(self, mcp_client, sample_spreadsheet_id):
+    async def test_large_range_read(self, mcp_client, sample_spreadsheet_id, large_values):
         """Test reading a large range."""
         client, mock_service = mcp_client
 
-        # Generate large mock data
-        large_data = [[f"Cell {i},{j}" for j in range(100)] for i in range(1000)]
         mock_service.spreadsheets().values().get().execute.return_value = {
-            'values': large_data
+            'values': large_values
         }
 
         result = await client.call_tool(
@@ -1028,7 +1548,7 @@ class TestEdgeCases:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert len(result_data) == 1000
         assert len(result_data[0]) == 100
 
@@ -1056,7 +1576,7 @@ class TestEdgeCases:
             }
         )
 
-        result_data = json.loads(result.data)
+        result_data = result.data
         assert result_data['updatedCells'] == 4
 
 
@@ -1083,7 +1603,7 @@ class TestWorkflows:
             arguments={"title": "Workflow Test"}
         )
 
-        create_data = json.loads(create_result.data)
+        create_data = create_result.data
         assert create_data['spreadsheetId'] == sample_spreadsheet_id
 
         # Mock write
@@ -1101,7 +1621,7 @@ class TestWorkflows:
             }
         )
 
-        write_data = json.loads(write_result.data)
+        write_data = write_result.data
         assert write_data['updatedCells'] == 12
 
         # Mock read
@@ -1118,58 +1638,398 @@ class TestWorkflows:
             }
         )
 
-        read_data = json.loads(read_result.data)
+        read_data = read_result.data
         assert read_data == sample_values
 
     async def test_format_and_chart_workflow(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
-        """Test workflow: format header, add borders, create chart."""
+        """Test workflow: format header, add borders and create chart as concurrent tool calls."""
         client, mock_service = mcp_client
 
         mock_service.spreadsheets().batchUpdate().execute.return_value = {}
 
-        # Format header
-        format_result = await client.call_tool(
-            name="sheets_format_cells",
+        # The three edits are independent, so they are issued together
+        format_result, border_result, chart_result = await asyncio.gather(
+            client.call_tool(
+                name="sheets_format_cells",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_id": sample_sheet_id,
+                    "start_row": 0,
+                    "end_row": 1,
+                    "start_col": 0,
+                    "end_col": 5,
+                    "bold": True,
+                    "bg_color": "#4285F4",
+                    "text_color": "#FFFFFF"
+                }
+            ),
+            client.call_tool(
+                name="sheets_add_borders",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_id": sample_sheet_id,
+                    "start_row": 0,
+                    "end_row": 20,
+                    "start_col": 0,
+                    "end_col": 5
+                }
+            ),
+            client.call_tool(
+                name="sheets_add_chart",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "sheet_id": sample_sheet_id,
+                    "chart_type": "COLUMN",
+                    "data_range": "Sheet1!A1:B20",
+                    "title": "Data Visualization"
+                }
+            )
+        )
+
+        assert format_result.data['success'] is True
+        assert border_result.data['success'] is True
+        assert chart_result.data['success'] is True
+
+    async def test_format_and_chart_single_batch(self, mcp_client, sample_spreadsheet_id, sample_sheet_id):
+        """Test workflow: format header, add borders and create chart in one batchUpdate."""
+        client, mock_service = mcp_client
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            'replies': [{}, {}, {'addChart': {'chart': {'chartId': 7}}}]
+        }
+        batch_update.reset_mock()
+
+        header = {'sheetId': sample_sheet_id, 'startRowIndex': 0, 'endRowIndex': 1, 'startColumnIndex': 0, 'endColumnIndex': 5}
+        table = {'sheetId': sample_sheet_id, 'startRowIndex': 0, 'endRowIndex': 20, 'startColumnIndex': 0, 'endColumnIndex': 5}
+        solid = {'style': 'SOLID'}
+
+        result = await client.call_tool(
+            name="sheets_batch_update",
             arguments={
                 "spreadsheet_id": sample_spreadsheet_id,
-                "sheet_id": sample_sheet_id,
-                "start_row": 0,
-                "end_row": 1,
-                "start_col": 0,
-                "end_col": 5,
-                "bold": True,
-                "bg_color": "#4285F4",
-                "text_color": "#FFFFFF"
+                "requests": [
+                    {'repeatCell': {
+                        'range': header,
+                        'cell': {'userEnteredFormat': {'textFormat': {'bold': True}}},
+                        'fields': 'userEnteredFormat'
+                    }},
+                    {'updateBorders': {'range': table, 'top': solid, 'bottom': solid, 'left': solid, 'right': solid}},
+                    {'addChart': {'chart': {'spec': {'title': 'Data Visualization', 'basicChart': {'chartType': 'COLUMN'}}}}}
+                ]
             }
         )
 
-        assert json.loads(format_result.data)['success'] is True
+        assert batch_update.call_count == 1
+        assert len(batch_update.call_args.kwargs['body']['requests']) == 3
+        assert result.data['replies'][2]['addChart']['chart']['chartId'] == 7
 
-        # Add borders
-        border_result = await client.call_tool(
-            name="sheets_add_borders",
+
+# ============================================================================
+# SERVICE LIFECYCLE TESTS
+# ============================================================================
+
+class TestServiceCache:
+    """Tests for the cached Sheets API service."""
+
+    async def test_service_built_once_across_calls(self, mcp_client, sample_spreadsheet_id, sample_values):
+        """Test that repeated tool calls reuse the same service."""
+        client, mock_service = mcp_client
+        from src import server
+
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            'values': sample_values
+        }
+
+        for _ in range(3):
+            await client.call_tool(
+                name="sheets_read",
+                arguments={
+                    "spreadsheet_id": sample_spreadsheet_id,
+                    "range": "Sheet1!A1:C4"
+                }
+            )
+
+        assert server.build.call_count == 1
+
+    async def test_credentials_fetched_off_event_loop(self, mcp_client, mock_credentials, sample_spreadsheet_id):
+        """Test that tools only read credentials in worker threads, so a token refresh never blocks the loop."""
+        client, mock_service = mcp_client
+        from src import server
+
+        callers = []
+        server.get_credentials.side_effect = lambda: callers.append(threading.current_thread()) or mock_credentials
+        mock_service.spreadsheets().values().get().execute.return_value = {'values': [['A']]}
+        mock_service.spreadsheets().batchUpdate().execute.return_value = {'replies': [{}]}
+
+        await client.call_tool(
+            name="sheets_read",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "range": "Sheet1!A1"}
+        )
+        await client.call_tool(
+            name="sheets_delete_rows",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "sheet_id": 0, "start_row": 1, "end_row": 2}
+        )
+
+        assert len(callers) == 2
+        assert threading.current_thread() not in callers
+
+    def test_response_model_parses_json_bytes(self):
+        """Test that API response bodies are decoded by the native JSON model."""
+        from src import server
+
+        model = server._JsonModel()
+        assert model.deserialize(b'{"values": [["a", "b"]]}') == {'values': [['a', 'b']]}
+        assert model.deserialize(b'not json') == 'not json'
+
+    def test_request_model_encodes_compact_json(self):
+        """Test that request bodies are compact and stay ASCII."""
+        from src import server
+
+        body = server._JsonModel().serialize({'requests': [{'sortRange': {'range': {'sheetId': 0}}}]})
+        assert body == '{"requests":[{"sortRange":{"range":{"sheetId":0}}}]}'
+
+        values = {'values': [['Café', '日本 😀']]}
+        body = server._JsonModel().serialize(values)
+        assert body.isascii()
+        assert json.loads(body) == values
+
+
+class TestCredentials:
+    """Tests for credential caching and refresh."""
+
+    def test_env_credentials_cached_until_near_expiry(self, monkeypatch):
+        """Test that env credentials are refreshed once and reused until close to expiry."""
+        from src import server
+
+        monkeypatch.setattr(server, 'CLIENT_ID', 'client-id')
+        monkeypatch.setattr(server, 'CLIENT_SECRET', 'client-secret')
+        monkeypatch.setattr(server, 'REFRESH_TOKEN', 'refresh-token')
+        monkeypatch.setattr(server, '_creds', None)
+
+        refreshes = []
+
+        def fake_refresh(creds, request):
+            refreshes.append(creds)
+            creds.token = 'access-token'
+            creds.expiry = server._utcnow() + timedelta(hours=1)
+
+        monkeypatch.setattr(server.Credentials, 'refresh', fake_refresh)
+
+        first = server.get_credentials()
+        second = server.get_credentials()
+        assert first is second
+        assert len(refreshes) == 1
+
+        first.expiry = server._utcnow() + timedelta(minutes=1)
+        assert server.get_credentials() is first
+        assert len(refreshes) == 2
+
+
+class TestRequestExecution:
+    """Tests for how Sheets API requests are executed."""
+
+    async def test_execute_runs_off_event_loop_thread(self, mcp_client, sample_spreadsheet_id):
+        """Test that blocking .execute() calls do not run on the event loop thread."""
+        client, mock_service = mcp_client
+        loop_thread = threading.get_ident()
+        execute_threads = []
+
+        def fake_execute(**kwargs):
+            execute_threads.append(threading.get_ident())
+            return {'values': [['A']]}
+
+        mock_service.spreadsheets().values().get().execute.side_effect = fake_execute
+
+        await client.call_tool(
+            name="sheets_read",
             arguments={
                 "spreadsheet_id": sample_spreadsheet_id,
-                "sheet_id": sample_sheet_id,
-                "start_row": 0,
-                "end_row": 20,
-                "start_col": 0,
-                "end_col": 5
+                "range": "Sheet1!A1"
             }
         )
 
-        assert json.loads(border_result.data)['success'] is True
+        assert execute_threads
+        assert loop_thread not in execute_threads
 
-        # Add chart
-        chart_result = await client.call_tool(
-            name="sheets_add_chart",
+    async def test_rate_limited_request_is_retried(self, mcp_client, sample_spreadsheet_id):
+        """Test that a 429 response is retried after the Retry-After delay."""
+        client, mock_service = mcp_client
+
+        rate_limited = HttpError(httplib2.Response({'status': 429, 'retry-after': '0'}), b'')
+        execute = mock_service.spreadsheets().values().get().execute
+        execute.side_effect = [rate_limited, {'values': [['A']]}]
+
+        result = await client.call_tool(
+            name="sheets_read",
             arguments={
                 "spreadsheet_id": sample_spreadsheet_id,
-                "sheet_id": sample_sheet_id,
-                "chart_type": "COLUMN",
-                "data_range": "Sheet1!A1:B20",
-                "title": "Data Visualization"
+                "range": "Sheet1!A1"
             }
         )
 
-        assert json.loads(chart_result.data)['success'] is True
+        assert result.data == [['A']]
+        assert execute.call_count == 2
+
+    async def test_server_error_is_retried_with_backoff(self, mcp_client, sample_spreadsheet_id, monkeypatch):
+        """Test that a transient 503 is retried, while a 400 fails immediately."""
+        client, mock_service = mcp_client
+        from src import server
+
+        monkeypatch.setattr(server, '_retry_delay', lambda error, attempt: 0)
+
+        unavailable = HttpError(httplib2.Response({'status': 503}), b'')
+        execute = mock_service.spreadsheets().values().get().execute
+        execute.side_effect = [unavailable, {'values': [['A']]}]
+
+        result = await client.call_tool(
+            name="sheets_read",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "range": "Sheet1!A1"}
+        )
+
+        assert result.data == [['A']]
+        assert execute.call_count == 2
+
+        execute.reset_mock()
+        execute.side_effect = HttpError(httplib2.Response({'status': 400}), b'')
+
+        with pytest.raises(ToolError):
+            await client.call_tool(
+                name="sheets_read",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "range": "Sheet1!A1"}
+            )
+
+        assert execute.call_count == 1
+
+    async def test_write_not_retried_on_ambiguous_server_error(self, mcp_client, sample_spreadsheet_id, monkeypatch):
+        """Test that a 502 is retried for a GET but not for a batchUpdate POST that may have been applied."""
+        client, mock_service = mcp_client
+        from src import server
+
+        monkeypatch.setattr(server, '_retry_delay', lambda error, attempt: 0)
+        bad_gateway = HttpError(httplib2.Response({'status': 502}), b'')
+
+        read = mock_service.spreadsheets().values().get()
+        read.method = 'GET'
+        read.execute.side_effect = [bad_gateway, {'values': [['A']]}]
+
+        result = await client.call_tool(
+            name="sheets_read",
+            arguments={"spreadsheet_id": sample_spreadsheet_id, "range": "Sheet1!A1"}
+        )
+        assert result.data == [['A']]
+
+        write = mock_service.spreadsheets().batchUpdate()
+        write.method = 'POST'
+        write.execute.side_effect = bad_gateway
+        write.execute.reset_mock()
+
+        with pytest.raises(ToolError):
+            await client.call_tool(
+                name="sheets_delete_rows",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "sheet_id": 0, "start_row": 1, "end_row": 2}
+            )
+
+        assert write.execute.call_count == 1
+
+    def test_retry_after_is_capped(self):
+        """Test that a long Retry-After is capped at MAX_RETRY_DELAY."""
+        from src import server
+
+        error = HttpError(httplib2.Response({'status': 429, 'retry-after': '3600'}), b'')
+
+        assert server._retry_delay(error, 0) == server.MAX_RETRY_DELAY
+
+    def test_worker_thread_reuses_http_client(self, mock_credentials):
+        """Test that a worker thread keeps one connection pool across requests."""
+        from src import server
+
+        first = server._thread_http(mock_credentials)
+        second = server._thread_http(mock_credentials)
+
+        assert first.http is second.http
+        assert first.credentials is mock_credentials
+
+    async def test_concurrent_batch_updates_are_coalesced(self, mcp_client, sample_spreadsheet_id, monkeypatch):
+        """Test that concurrent batchUpdate tools share one API call and get their own replies."""
+        client, mock_service = mcp_client
+        from src import server
+
+        monkeypatch.setattr(server, 'BATCH_WINDOW_SECONDS', 0.05)
+
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.return_value = {
+            'replies': [
+                {'findReplace': {'occurrencesChanged': 2}},
+                {'findReplace': {'occurrencesChanged': 3}}
+            ]
+        }
+        batch_update.reset_mock()
+
+        first, second = await asyncio.gather(
+            client.call_tool(
+                name="sheets_find_replace",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "a", "replacement": "b"}
+            ),
+            client.call_tool(
+                name="sheets_find_replace",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "c", "replacement": "d"}
+            )
+        )
+
+        assert batch_update.call_count == 1
+        assert len(batch_update.call_args.kwargs['body']['requests']) == 2
+        assert first.data['replacements'] == 2
+        assert second.data['replacements'] == 3
+
+    async def test_rejected_batch_only_fails_the_offending_caller(self, mcp_client, sample_spreadsheet_id, monkeypatch):
+        """Test that when a coalesced call is rejected, each caller is resent alone and only the bad one fails."""
+        client, mock_service = mcp_client
+        from src import server
+
+        monkeypatch.setattr(server, 'BATCH_WINDOW_SECONDS', 0.05)
+
+        rejected = HttpError(httplib2.Response({'status': 400}), b'')
+        batch_update = mock_service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.side_effect = [
+            rejected,
+            rejected,
+            {'replies': [{'findReplace': {'occurrencesChanged': 3}}]}
+        ]
+        batch_update.reset_mock()
+
+        bad, good = await asyncio.gather(
+            client.call_tool(
+                name="sheets_batch_update",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "requests": [{'deleteSheet': {'sheetId': 999}}]}
+            ),
+            client.call_tool(
+                name="sheets_find_replace",
+                arguments={"spreadsheet_id": sample_spreadsheet_id, "find": "c", "replacement": "d"}
+            ),
+            return_exceptions=True
+        )
+
+        assert isinstance(bad, ToolError)
+        assert good.data['replacements'] == 3
+        sent = [call.kwargs['body']['requests'] for call in batch_update.call_args_list]
+        assert [len(requests) for requests in sent] == [2, 1, 1]
+
+
+class TestClientLogging:
+    """Test progress messages sent to the client."""
+
+    async def test_info_skipped_when_log_level_above_info(self, monkeypatch):
+        """Test that info messages are neither formatted nor sent when LOG_LEVEL is WARNING."""
+        from src import server
+
+        ctx = MagicMock()
+        ctx.info = AsyncMock()
+
+        monkeypatch.setattr(server, 'INFO_ENABLED', False)
+        await server._info(ctx, "Reading range: %s", "Sheet1!A1")
+        ctx.info.assert_not_called()
+
+        monkeypatch.setattr(server, 'INFO_ENABLED', True)
+        await server._info(ctx, "Reading range: %s", "Sheet1!A1")
+        ctx.info.assert_awaited_once_with("Reading range: Sheet1!A1")